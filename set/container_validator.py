@@ -18,6 +18,8 @@ import os
 import sys
 import json
 import hashlib
+import functools
+import logging
 import platform
 from datetime import datetime, timezone, timedelta
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -35,6 +37,10 @@ except ImportError:
     print("Install with: pip install cryptography")
     sys.exit(1)
 
+# Signature verification parameters (immutable, shared by every verify)
+_SHA512 = hashes.SHA512()
+_PSS = padding.PSS(mgf=padding.MGF1(_SHA512), salt_length=padding.PSS.MAX_LENGTH)
+
 # ===========================================
 # CONFIGURATION
 # ===========================================
@@ -48,11 +54,17 @@ GRACE_PERIOD_DAYS = 7
 # v3.0 NEW: Periodic revalidation interval (1 hour)
 REVALIDATION_INTERVAL = 3600  # Check every 1 hour
 
+# How long validate_license_cached() reuses a failed result
+INVALID_CACHE_SECONDS = 5
+
 # v3.0 NEW: Import additional modules for periodic checks
 import threading
 import time
 import signal
 
+# Periodic revalidation logs through logging so verbose lines cost nothing at INFO
+log = logging.getLogger("license.revalidate")
+
 # ===========================================
 # MACHINE FINGERPRINT - v3.0 CORRECTED
 # ===========================================
@@ -140,6 +152,25 @@ def generate_hardware_fingerprint():
     return fingerprint
 
 
+# Parsed machine_id.json as (mtime_ns, saved_fingerprint)
+_machine_id_cache = None
+
+
+def load_saved_fingerprint(machine_id_path, mtime_ns):
+    """Read saved fingerprint, re-parsing machine_id.json only when its mtime changes"""
+    global _machine_id_cache
+    
+    if _machine_id_cache is not None and _machine_id_cache[0] == mtime_ns:
+        return _machine_id_cache[1]
+    
+    with open(machine_id_path, 'r') as f:
+        data = json.load(f)
+    saved_fingerprint = data.get('machine_fingerprint') or data.get('fingerprint')
+    
+    _machine_id_cache = (mtime_ns, saved_fingerprint)
+    return saved_fingerprint
+
+
 def get_machine_fingerprint():
     """
     v3.0 FIX #1: Always verify fingerprint against real hardware
@@ -154,12 +185,15 @@ def get_machine_fingerprint():
         return None
     
     # Check if saved fingerprint exists
-    if os.path.exists(machine_id_path):
+    try:
+        machine_id_mtime = os.stat(machine_id_path).st_mtime_ns
+    except OSError:
+        machine_id_mtime = None
+    
+    if machine_id_mtime is not None:
         try:
             print(f"\n🔐 Verifying against saved fingerprint...")
-            with open(machine_id_path, 'r') as f:
-                data = json.load(f)
-                saved_fingerprint = data.get('machine_fingerprint') or data.get('fingerprint')
+            saved_fingerprint = load_saved_fingerprint(machine_id_path, machine_id_mtime)
             
             if saved_fingerprint:
                 if saved_fingerprint == real_fingerprint:
@@ -223,6 +257,15 @@ def load_public_key():
         return None, f"Failed to load public key: {e}"
 
 
+# One shared encoder - same bytes as json.dumps(cert, sort_keys=True)
+_canonical_encode = json.JSONEncoder(sort_keys=True).encode
+
+
+def canonical_certificate_json(cert):
+    """Canonical (sorted-keys) JSON bytes, exactly as the server signs them"""
+    return _canonical_encode(cert).encode('utf-8')
+
+
 def verify_certificate_signature(certificate, public_key):
     """Verify RSA signature"""
     try:
@@ -240,18 +283,10 @@ def verify_certificate_signature(certificate, public_key):
         cert_copy.pop('signature_timestamp', None)
         
         # Serialize to bytes (sorted keys for consistency)
-        cert_json = json.dumps(cert_copy, sort_keys=True).encode('utf-8')
+        cert_json = canonical_certificate_json(cert_copy)
         
         # Verify signature
-        public_key.verify(
-            signature_bytes,
-            cert_json,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA512()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA512()
-        )
+        public_key.verify(signature_bytes, cert_json, _PSS, _SHA512)
         
         return True, None
     
@@ -313,18 +348,27 @@ def check_machine_fingerprint(certificate, real_fingerprint):
         return False, f"fingerprint_check_failed: {e}"
 
 
-def check_service_permission(certificate, service_name):
+def get_enabled_services(certificate):
+    """Names of the Docker services enabled by the certificate"""
+    docker_services = certificate.get('docker', {}).get('services', {})
+    return frozenset(
+        name for name, config in docker_services.items() if config.get('enabled')
+    )
+
+
+def check_service_permission(certificate, service_name, enabled_services=None):
     """Check if this service is allowed"""
     try:
-        docker_services = certificate.get('docker', {}).get('services', {})
+        if enabled_services is None:
+            enabled_services = get_enabled_services(certificate)
+        
+        if service_name in enabled_services:
+            return True, None
         
+        docker_services = certificate.get('docker', {}).get('services', {})
         if service_name in docker_services:
-            service_config = docker_services[service_name]
-            if service_config.get('enabled', False):
-                return True, None
-            else:
-                reason = service_config.get('reason_disabled', 'Service not enabled')
-                return False, f"service_disabled: {reason}"
+            reason = docker_services[service_name].get('reason_disabled', 'Service not enabled')
+            return False, f"service_disabled: {reason}"
         
         # If service not in list, allow by default (backward compatibility)
         return True, None
@@ -436,7 +480,8 @@ def validate_license():
     
     # Step 7: Check service permission
     print(f"\nChecking service permissions...")
-    service_ok, err = check_service_permission(certificate, SERVICE_NAME)
+    enabled_services = get_enabled_services(certificate)
+    service_ok, err = check_service_permission(certificate, SERVICE_NAME, enabled_services)
     if not service_ok:
         result = err
         print(f"  ✗ Service '{SERVICE_NAME}' not allowed")
@@ -474,6 +519,30 @@ def validate_license():
     return True, "valid", details
 
 
+# Last validate_license() outcome as (time.monotonic(), result)
+_last_validation = None
+
+
+def validate_license_cached(max_age=60):
+    """
+    validate_license() with an in-process result cache for repeated probes.
+    Valid results are reused for max_age seconds, invalid ones for
+    INVALID_CACHE_SECONDS so a failing startup is not re-verified on every call.
+    """
+    global _last_validation
+    
+    now = time.monotonic()
+    if _last_validation is not None:
+        checked_at, result = _last_validation
+        ttl = max_age if result[0] else min(max_age, INVALID_CACHE_SECONDS)
+        if now - checked_at < ttl:
+            return result
+    
+    result = validate_license()
+    _last_validation = (now, result)
+    return result
+
+
 # ===========================================
 # ERROR PAGE SERVER
 # ===========================================
@@ -595,6 +664,19 @@ def serve_error_page(result, port):
 # PERIODIC REVALIDATION (v3.0 FIX #2)
 # ===========================================
 
+# Parsed certificate.json keyed by its st_mtime_ns
+_cert_cache = {"mtime": None, "cert": None}
+
+
+@functools.lru_cache(maxsize=1)
+def build_heartbeat_body(machine_fingerprint, service_name):
+    """Encoded heartbeat payload, rebuilt only when the fingerprint changes"""
+    return json.dumps({
+        "machine_fingerprint": machine_fingerprint,
+        "service_name": service_name
+    }).encode('utf-8')
+
+
 def periodic_revalidation():
     """
     v3.0 FIX #2: Periodic license revalidation (every 1 hour)
@@ -602,26 +684,29 @@ def periodic_revalidation():
     - Checks server heartbeat (if online)
     - Terminates services if invalid/expired/revoked
     """
-    print(f"\n🔄 Periodic revalidation started (every {REVALIDATION_INTERVAL}s = {REVALIDATION_INTERVAL//3600}h)")
+    log.info("Periodic revalidation started (every %ss = %sh)",
+             REVALIDATION_INTERVAL, REVALIDATION_INTERVAL // 3600)
     
     while True:
         try:
             time.sleep(REVALIDATION_INTERVAL)
             
-            print(f"\n" + "="*70)
-            print(f"🔄 PERIODIC REVALIDATION CHECK")
-            print(f"  Time: {datetime.now(timezone.utc).isoformat()}")
-            print("="*70)
+            log.debug("Periodic revalidation check at %s", datetime.now(timezone.utc).isoformat())
             
-            # Load certificate
+            # Load certificate (re-parsed only when the file changes)
             cert_path = os.path.join(LICENSE_PATH, "certificate.json")
-            if not os.path.exists(cert_path):
-                print(f"  ✗ Certificate file not found!")
+            try:
+                st = os.stat(cert_path)
+            except FileNotFoundError:
+                log.error("Certificate file not found: %s", cert_path)
                 os.kill(os.getpid(), signal.SIGTERM)
                 return
             
-            with open(cert_path, 'r') as f:
-                certificate = json.load(f)
+            if _cert_cache["mtime"] != st.st_mtime_ns:
+                with open(cert_path, 'r') as f:
+                    _cert_cache["cert"] = json.load(f)
+                _cert_cache["mtime"] = st.st_mtime_ns
+            certificate = _cert_cache["cert"]
             
             # Check expiry
             validity = certificate.get('validity', {})
@@ -633,33 +718,28 @@ def periodic_revalidation():
                 now = datetime.now(timezone.utc)
                 
                 if now > valid_until:
-                    print(f"\n  ✗✗✗ CERTIFICATE EXPIRED ✗✗✗")
-                    print(f"  → Terminating services...")
+                    log.error("Certificate expired at %s - terminating services", valid_until_str)
                     os.kill(os.getpid(), signal.SIGTERM)
                     return
                 else:
                     days_remaining = (valid_until - now).days
-                    print(f"  ✓ Certificate valid (expires in {days_remaining} days)")
+                    log.debug("Certificate valid (expires in %d days)", days_remaining)
             
             # Check fingerprint
             real_fp = get_machine_fingerprint()
             if not real_fp:
-                print(f"  ✗ Fingerprint verification failed")
+                log.error("Fingerprint verification failed - terminating services")
                 os.kill(os.getpid(), signal.SIGTERM)
                 return
             
             # Check server heartbeat (graceful failure if offline)
             try:
-                print(f"  → Checking with license server...")
+                log.debug("Checking with license server...")
                 heartbeat_url = f"{LICENSE_SERVER}/api/v1/heartbeat"
-                heartbeat_data = {
-                    "machine_fingerprint": real_fp,
-                    "service_name": SERVICE_NAME
-                }
                 
                 req = urllib.request.Request(
                     heartbeat_url,
-                    data=json.dumps(heartbeat_data).encode('utf-8'),
+                    data=build_heartbeat_body(real_fp, SERVICE_NAME),
                     headers={'Content-Type': 'application/json'},
                     method='POST'
                 )
@@ -668,21 +748,19 @@ def periodic_revalidation():
                     result = json.loads(response.read().decode('utf-8'))
                     
                     if result.get('valid') == False:
-                        print(f"\n  ✗✗✗ LICENSE REVOKED ✗✗✗")
+                        log.error("License revoked by server - terminating services")
                         os.kill(os.getpid(), signal.SIGTERM)
                         return
                     else:
-                        print(f"  ✓ Server heartbeat OK")
+                        log.debug("Server heartbeat OK")
             
             except Exception as e:
-                print(f"  ⚠ Cannot reach server (offline mode): {e}")
-                print(f"  → Continuing (will check again in 1 hour)")
+                log.warning("Cannot reach server (offline mode): %s - will check again in 1 hour", e)
             
-            print(f"\n✅ Periodic revalidation PASSED")
-            print("="*70)
+            log.info("Periodic revalidation PASSED")
         
         except Exception as e:
-            print(f"\n⚠ Periodic revalidation error: {e}")
+            log.warning("Periodic revalidation error: %s", e)
 
 
 # ===========================================
@@ -692,6 +770,16 @@ def periodic_revalidation():
 def main():
     """Main entry point with v3.0 periodic revalidation"""
     
+    # A mistyped LOG_LEVEL must not keep the container from starting
+    level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(message)s",
+        level=level if isinstance(level, int) else logging.INFO
+    )
+    if not isinstance(level, int):
+        log.warning("Unknown LOG_LEVEL %r - using INFO", level_name)
+    
     # Initial validation
     valid, reason, details = validate_license()
     
@@ -17,26 +17,70 @@ import sys
 import json
 import hashlib
 import base64
+import functools
 import secrets
+import shutil
 import subprocess
 import threading
+import time
 import socket
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 import platform
 import uuid
+import webbrowser
 
-# Third-party imports
+# Third-party imports - requests and cryptography are imported on first use
+# (_import_requests, _get_aesgcm) so the window opens without loading them.
+# Plain import statements, so PyInstaller still bundles both.
+
+# Optional - native socket table for port owner lookup (netstat fallback without it)
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Optional - faster JSON for certificate/fingerprint files (stdlib json fallback)
 try:
-    import requests
-    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    import orjson
 except ImportError:
-    print("Installing required packages...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "cryptography"])
-    import requests
-    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    orjson = None
+
+
+def _pip_install(package: str):
+    """Install a missing required package (only happens when run from source)"""
+    print(f"Installing required package {package}...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+
+
+def _import_requests():
+    """requests module, imported on first use"""
+    try:
+        import requests
+    except ImportError:
+        _pip_install("requests")
+        import requests
+    return requests
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented (2-space) JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # ===========================================
@@ -62,14 +106,66 @@ REQUIRED_PORTS = {
     27017: "MongoDB"
 }
 
+# Named fonts - created once on the Tk root and referenced by name from every widget
+WIZARD_FONTS = {
+    "WizardSmall": {"family": "Segoe UI", "size": 8},
+    "WizardBody": {"family": "Segoe UI", "size": 9},
+    "WizardBold": {"family": "Segoe UI", "size": 9, "weight": "bold"},
+    "WizardText": {"family": "Segoe UI", "size": 10},
+    "WizardTextBold": {"family": "Segoe UI", "size": 10, "weight": "bold"},
+    "WizardHeader": {"family": "Segoe UI", "size": 16, "weight": "bold"},
+}
+
+# Host facts - fixed for the process lifetime, queried once
+_SYSTEM = platform.system()
+_NODE = platform.node()
+_MACHINE = platform.machine()
+_RELEASE = platform.release()
+
+# Windows-only modules, imported once here instead of inside each check
+if _SYSTEM == "Windows":
+    import ctypes
+    import winreg
+    
+    class MEMORYSTATUSEX(ctypes.Structure):
+        """GlobalMemoryStatusEx result (handles >4GB RAM)"""
+        _fields_ = [
+            ('dwLength', ctypes.c_ulong),
+            ('dwMemoryLoad', ctypes.c_ulong),
+            ('ullTotalPhys', ctypes.c_ulonglong),
+            ('ullAvailPhys', ctypes.c_ulonglong),
+            ('ullTotalPageFile', ctypes.c_ulonglong),
+            ('ullAvailPageFile', ctypes.c_ulonglong),
+            ('ullTotalVirtual', ctypes.c_ulonglong),
+            ('ullAvailVirtual', ctypes.c_ulonglong),
+            ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+        ]
+
+# Child processes (docker, netstat) get no console window - a --windowed build
+# would otherwise flash one per call. Passed as **_NO_WINDOW to every spawn.
+_NO_WINDOW = {}
+if _SYSTEM == "Windows":
+    _startupinfo = subprocess.STARTUPINFO()
+    _startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _NO_WINDOW = {"startupinfo": _startupinfo, "creationflags": subprocess.CREATE_NO_WINDOW}
+
 # Installation directory - IMPORTANT: Must match where your certificates are stored!
-if platform.system() == "Windows":
+if _SYSTEM == "Windows":
     INSTALL_DIR = Path(os.environ.get("PROGRAMDATA", "C:\\ProgramData")) / "AILicenseDashboard"
 else:
     INSTALL_DIR = Path.home() / ".genx-platform"  # User directory (no sudo needed)
 
 LICENSE_DIR = INSTALL_DIR / "license"
 
+# Icon path, looked up once: current directory, then script directory, then install directory
+_RESOLVED_ICON = next(
+    (path for path in (ICON_FILE,
+                       os.path.join(os.path.dirname(__file__), ICON_FILE),
+                       str(INSTALL_DIR / ICON_FILE))
+     if os.path.exists(path)),
+    None
+)
+
 
 # ===========================================
 # UTILITY CLASSES
@@ -78,84 +174,112 @@ LICENSE_DIR = INSTALL_DIR / "license"
 class MachineFingerprint:
     """Generate unique machine fingerprint"""
     
-    @staticmethod
-    def get_fingerprint() -> str:
+    # Fixed for the process lifetime - read/generated once
+    _cached_fp: Optional[str] = None
+    
+    @classmethod
+    def get_fingerprint(cls) -> str:
+        if cls._cached_fp:
+            return cls._cached_fp
+        
         fp_file = LICENSE_DIR / "machine_id.json"
-        if fp_file.exists():
-            try:
-                with open(fp_file, "r") as f:
-                    data = json.load(f)
-                    return data.get("fingerprint", "")
-            except:
-                pass
+        # Just try the read - a missing file costs no extra stat()
+        try:
+            data = _json_loads(fp_file.read_bytes())
+            cls._cached_fp = data.get("fingerprint", "")
+            return cls._cached_fp
+        except:
+            pass
         
-        fingerprint = MachineFingerprint._generate_fingerprint()
+        fingerprint = cls._generate_fingerprint()
         
         LICENSE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(fp_file, "w") as f:
-            json.dump({
-                "fingerprint": fingerprint,
-                "generated_at": datetime.now().isoformat(),
-                "hostname": platform.node()
-            }, f, indent=2)
+        fp_file.write_bytes(_json_dumps({
+            "fingerprint": fingerprint,
+            "generated_at": datetime.now().isoformat(),
+            "hostname": _NODE
+        }))
         
+        cls._cached_fp = fingerprint
         return fingerprint
     
     @staticmethod
     def _generate_fingerprint() -> str:
         components = []
-        components.append(f"hostname:{platform.node()}")
-        components.append(f"system:{platform.system()}")
-        components.append(f"machine:{platform.machine()}")
+        components.append(f"hostname:{_NODE}".encode())
+        components.append(f"system:{_SYSTEM}".encode())
+        components.append(f"machine:{_MACHINE}".encode())
         
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             try:
-                import winreg
                 key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Cryptography")
                 machine_guid = winreg.QueryValueEx(key, "MachineGuid")[0]
-                components.append(f"machine_guid:{machine_guid}")
+                components.append(f"machine_guid:{machine_guid}".encode())
                 winreg.CloseKey(key)
             except:
                 pass
             
+            # ProcessorId stays a fingerprint input (byte-compatible with container_validator.py,
+            # same timeout). Only runs when machine_id.json is missing, on the startup prefetch thread.
             try:
-                result = subprocess.run(["wmic", "cpu", "get", "ProcessorId"], capture_output=True, text=True)
+                result = subprocess.run(["wmic", "cpu", "get", "ProcessorId"], capture_output=True, text=True,
+                                        timeout=5, **_NO_WINDOW)
                 cpu_id = result.stdout.strip().split('\n')[-1].strip()
                 if cpu_id:
-                    components.append(f"cpu:{cpu_id}")
+                    components.append(f"cpu:{cpu_id}".encode())
             except:
                 pass
         else:
             try:
                 with open("/etc/machine-id", "r") as f:
-                    components.append(f"machine_id:{f.read().strip()}")
+                    components.append(f"machine_id:{f.read().strip()}".encode())
             except:
                 pass
         
         if len(components) < 3:
-            components.append(f"random:{uuid.uuid4().hex}")
-        
-        combined = "|".join(sorted(components))
-        return hashlib.sha3_512(combined.encode()).hexdigest()
+            components.append(f"random:{uuid.uuid4().hex}".encode())
+        
+        # Components are bytes already - join straight into the hasher.
+        # SHA3-512 is part of the license contract: container_validator.py re-derives
+        # this value and certificates record fingerprint_algorithm "SHA3-512"
+        h = hashlib.sha3_512()
+        h.update(b"|".join(sorted(components)))
+        return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_aesgcm(key: bytes):
+    """AES-GCM cipher for a key, derived and set up once per key"""
+    try:
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    except ImportError:
+        _pip_install("cryptography")
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(CryptoUtils._derive_key(key))
 
 
 class CryptoUtils:
     """Encryption utilities"""
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _derive_key(fingerprint: bytes) -> bytes:
+        """AES-256 key from the machine fingerprint - must match the server's SHA256(machine_fingerprint)"""
+        return hashlib.sha256(fingerprint).digest()
+    
     @staticmethod
     def decrypt_credentials(encrypted_data: str, machine_fingerprint: str) -> dict:
-        derived_key = hashlib.sha256(machine_fingerprint.encode()).digest()
-        aesgcm = AESGCM(derived_key)
-        raw = base64.b64decode(encrypted_data)
+        aesgcm = _get_aesgcm(machine_fingerprint.encode())
+        # memoryview slices are zero-copy - AESGCM accepts any bytes-like input
+        raw = memoryview(base64.b64decode(encrypted_data))
         nonce = raw[:12]
         ciphertext = raw[12:]
         plaintext = aesgcm.decrypt(nonce, ciphertext, None)
-        return json.loads(plaintext.decode())
+        return _json_loads(plaintext)
     
     @staticmethod
     def encrypt_file(data: bytes, key: bytes) -> bytes:
-        derived_key = hashlib.sha256(key).digest()
-        aesgcm = AESGCM(derived_key)
+        aesgcm = _get_aesgcm(key)
         nonce = secrets.token_bytes(12)
         ciphertext = aesgcm.encrypt(nonce, data, None)
         return nonce + ciphertext
@@ -163,52 +287,173 @@ class CryptoUtils:
     @staticmethod
     def decrypt_file(encrypted_data: bytes, key: bytes) -> bytes:
         """Decrypt data encrypted with encrypt_file"""
-        derived_key = hashlib.sha256(key).digest()
-        aesgcm = AESGCM(derived_key)
-        nonce = encrypted_data[:12]
-        ciphertext = encrypted_data[12:]
+        aesgcm = _get_aesgcm(key)
+        raw = memoryview(encrypted_data)
+        nonce = raw[:12]
+        ciphertext = raw[12:]
         return aesgcm.decrypt(nonce, ciphertext, None)
 
 
+# How long a system check result is reused (wizard Back/Next re-runs checks)
+CHECK_CACHE_TTL = 5
+
+# Checks run at wizard startup are shown on the prerequisites page if no older than this
+CHECK_PREFETCH_MAX_AGE = 60
+
+
+def _ttl_cache(seconds: float):
+    """Memoize a function's results per arguments for `seconds` (thread-safe)"""
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            with lock:
+                hit = cache.get(args)
+            if hit is not None and time.monotonic() - hit[0] < seconds:
+                return hit[1]
+            result = func(*args)
+            with lock:
+                cache[args] = (time.monotonic(), result)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
 class SystemChecker:
     """System requirements checker"""
     
+    # Checks that are shown but don't block installation
+    INFORMATIONAL_CHECKS = ("disk", "memory")
+    
+    _docker_probe_lock = threading.Lock()
+    
+    @staticmethod
+    def clear_cache():
+        """Forget cached check results (e.g. user clicked Re-check)"""
+        for check in (SystemChecker.check_docker_installed, SystemChecker.check_docker_compose,
+                      SystemChecker.check_docker_running, SystemChecker.check_port_available,
+                      SystemChecker.check_disk_space, SystemChecker.check_memory):
+            check.cache_clear()
+    
     @staticmethod
+    def run_all_checks(fresh: bool = False, on_result=None) -> dict:
+        """
+        Run all checks concurrently - returns {check_id: (passed, info)}
+        on_result(check_id, passed, info) is called as each check finishes.
+        """
+        if fresh:
+            SystemChecker.clear_cache()
+        # Checks whose TTL expired re-probe docker once, not reuse the last round
+        SystemChecker._docker_info.cache_clear()
+        
+        checks = {
+            "docker": SystemChecker.check_docker_installed,
+            "compose": SystemChecker.check_docker_compose,
+            "docker_running": SystemChecker.check_docker_running,
+            "disk": SystemChecker.check_disk_space,
+            "memory": SystemChecker.check_memory,
+        }
+        for port in REQUIRED_PORTS:
+            checks[f"port_{port}"] = functools.partial(SystemChecker.check_port_available, port)
+        
+        # Each check blocks in subprocess/socket I/O, so threads overlap them
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {executor.submit(check): check_id for check_id, check in checks.items()}
+            for future in as_completed(futures):
+                check_id = futures[future]
+                results[check_id] = future.result()
+                if on_result:
+                    on_result(check_id, *results[check_id])
+        
+        return results
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _docker_info() -> dict:
+        # Client section (with CLI plugins) is printed even when the daemon is down
+        if shutil.which("docker") is None:
+            return {}
+        try:
+            result = subprocess.run(
+                ["docker", "info", "--format", "{{json .}}"],
+                capture_output=True, text=True, timeout=15,
+                **_NO_WINDOW
+            )
+            return _json_loads(result.stdout.strip() or "{}")
+        except Exception:
+            return {}
+    
+    @staticmethod
+    def _docker_info_cached() -> dict:
+        """Single `docker info` probe shared by the docker checks ({} if docker is missing)"""
+        # Checks run in parallel threads - serialize so only one of them spawns docker
+        with SystemChecker._docker_probe_lock:
+            return SystemChecker._docker_info()
+    
+    @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_docker_installed() -> tuple:
+        info = SystemChecker._docker_info_cached()
+        if info:
+            client = info.get("ClientInfo") or {}
+            return True, f"Docker {client.get('Version') or info.get('ServerVersion', '')}".strip()
+        
+        # Not on PATH - nothing to spawn
+        if shutil.which("docker") is None:
+            return False, "Not installed"
+        
+        # Older CLIs print no JSON at all while the daemon is down
         try:
-            result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
+            result = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=3, **_NO_WINDOW)
             if result.returncode == 0:
                 version = result.stdout.strip().split(',')[0].replace('Docker version ', '')
                 return True, f"Docker {version}"
-            return False, "Not installed"
         except:
-            return False, "Not installed"
+            pass
+        return False, "Not installed"
     
     @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_docker_compose() -> tuple:
-        try:
-            result = subprocess.run(["docker", "compose", "version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                return True, version
-            result = subprocess.run(["docker-compose", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return True, result.stdout.strip()
-            return False, "Not installed"
-        except:
+        client = SystemChecker._docker_info_cached().get("ClientInfo") or {}
+        for plugin in client.get("Plugins") or []:
+            if plugin.get("Name") == "compose":
+                return True, f"Docker Compose version {plugin.get('Version', '')}".strip()
+        
+        # Only probe the CLIs that are actually on PATH
+        has_v2 = shutil.which("docker") is not None
+        has_v1 = shutil.which("docker-compose") is not None
+        if not (has_v2 or has_v1):
             return False, "Not installed"
+        
+        # Plugin list not reported by this docker CLI - probe compose directly
+        for cmd, available in ((["docker", "compose", "version"], has_v2),
+                               (["docker-compose", "--version"], has_v1)):
+            if not available:
+                continue
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=5, **_NO_WINDOW)
+                if result.returncode == 0:
+                    return True, result.stdout.strip()
+            except:
+                pass
+        return False, "Not installed"
     
     @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_docker_running() -> tuple:
-        try:
-            result = subprocess.run(["docker", "info"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return True, "Running"
-            return False, "Not running"
-        except:
-            return False, "Not running"
+        # Server fields are only filled in when the daemon answered
+        if SystemChecker._docker_info_cached().get("ServerVersion"):
+            return True, "Running"
+        return False, "Not running"
     
     @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_port_available(port: int) -> tuple:
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -220,10 +465,17 @@ class SystemChecker:
             else:
                 # Try to find what's using it
                 try:
-                    if platform.system() == "Windows":
+                    if psutil is not None:
+                        for conn in psutil.net_connections(kind="tcp"):
+                            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                                if conn.pid:
+                                    return False, f"In use (PID: {conn.pid})"
+                                break
+                    elif _SYSTEM == "Windows":
                         result = subprocess.run(
                             ["netstat", "-ano"],
-                            capture_output=True, text=True
+                            capture_output=True, text=True,
+                            **_NO_WINDOW
                         )
                         for line in result.stdout.split('\n'):
                             if f":{port}" in line and "LISTENING" in line:
@@ -236,24 +488,11 @@ class SystemChecker:
             return True, "Available"
     
     @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_disk_space() -> tuple:
         try:
-            free_gb = 0  # Default value
-            
-            if platform.system() == "Windows":
-                import ctypes
-                free_bytes = ctypes.c_ulonglong(0)
-                # Get drive from install dir or default to C:
-                drive = str(INSTALL_DIR)[:3] if len(str(INSTALL_DIR)) >= 3 else "C:\\"
-                ctypes.windll.kernel32.GetDiskFreeSpaceExW(
-                    ctypes.c_wchar_p(drive),
-                    None, None, ctypes.pointer(free_bytes)
-                )
-                free_gb = free_bytes.value / (1024**3)
-            else:
-                check_path = INSTALL_DIR.parent if INSTALL_DIR.exists() else Path("/")
-                st = os.statvfs(str(check_path))
-                free_gb = (st.f_bavail * st.f_frsize) / (1024**3)
+            check_path = INSTALL_DIR if INSTALL_DIR.exists() else INSTALL_DIR.parent
+            free_gb = shutil.disk_usage(str(check_path)).free / (1024**3)
             
             if free_gb >= 2:
                 return True, f"{free_gb:.1f} GB free"
@@ -265,37 +504,25 @@ class SystemChecker:
             return True, "Unknown"
     
     @staticmethod
+    @_ttl_cache(CHECK_CACHE_TTL)
     def check_memory() -> tuple:
         try:
             total_gb = 0  # Default value
             
-            if platform.system() == "Windows":
-                import ctypes
-                
+            if _SYSTEM == "Windows":
                 # Use GlobalMemoryStatusEx for modern Windows (handles >4GB RAM)
-                class MEMORYSTATUSEX(ctypes.Structure):
-                    _fields_ = [
-                        ('dwLength', ctypes.c_ulong),
-                        ('dwMemoryLoad', ctypes.c_ulong),
-                        ('ullTotalPhys', ctypes.c_ulonglong),
-                        ('ullAvailPhys', ctypes.c_ulonglong),
-                        ('ullTotalPageFile', ctypes.c_ulonglong),
-                        ('ullAvailPageFile', ctypes.c_ulonglong),
-                        ('ullTotalVirtual', ctypes.c_ulonglong),
-                        ('ullAvailVirtual', ctypes.c_ulonglong),
-                        ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
-                    ]
-                
                 memory_status = MEMORYSTATUSEX()
                 memory_status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
                 ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(memory_status))
                 total_gb = memory_status.ullTotalPhys / (1024**3)
             else:
-                with open('/proc/meminfo', 'r') as f:
-                    for line in f:
-                        if 'MemTotal' in line:
-                            total_gb = int(line.split()[1]) / (1024**2)
-                            break
+                # MemTotal is the first line of /proc/meminfo - one small read is enough
+                fd = os.open('/proc/meminfo', os.O_RDONLY)
+                try:
+                    buf = os.read(fd, 128)
+                finally:
+                    os.close(fd)
+                total_gb = int(buf.split(b'MemTotal:')[1].split()[0]) / (1024**2)
             
             if total_gb >= 2:
                 return True, f"{total_gb:.1f} GB RAM"
@@ -312,17 +539,45 @@ class ActivationClient:
     
     def __init__(self, server_url: str):
         self.server_url = server_url.rstrip('/')
+        self._session = None
+    
+    @property
+    def session(self):
+        """
+        One pooled session so activate() reuses the connection from check_connection().
+        Built on the first request (on the activation worker thread, not at startup).
+        """
+        if self._session is None:
+            requests = _import_requests()
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            session.headers["User-Agent"] = f"AIDashboardInstaller/{APP_VERSION}"
+            # Retry transient gateway errors - urllib3 never retries the activation POST
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=2, pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
     
     def check_connection(self) -> bool:
+        """
+        GET /health must answer 200 - a bare TCP connect would also pass for a captive
+        portal, proxy or unrelated listener. Uses the pooled session, so activate()
+        reuses this connection.
+        """
         try:
-            response = requests.get(f"{self.server_url}/health", timeout=5)
+            response = self.session.get(f"{self.server_url}/health", timeout=5)
             return response.status_code == 200
         except:
             return False
     
     def activate(self, product_key: str, fingerprint: str, hostname: str, os_info: str) -> dict:
+        requests = _import_requests()
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.server_url}/api/v1/activate",
                 json={
                     "product_key": product_key,
@@ -367,40 +622,84 @@ class FileManager:
         self.install_dir = INSTALL_DIR
         self.license_dir = LICENSE_DIR
         self.data_dir = INSTALL_DIR / "data"
+        self._dirs_ready = False
+        self._cert_cache = (None, None)  # (file mtimes, parsed certificate)
     
     def setup_directories(self):
-        self.install_dir.mkdir(parents=True, exist_ok=True)
+        # Both are children of install_dir - creating them creates it too
         self.license_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ready = True
+    
+    @staticmethod
+    def _write_file(path: Path, data: bytes, mode: int = 0o600):
+        """
+        Write a small file with raw os.write calls (no buffered/text IO layer).
+        Goes through a temp file + os.replace so a crash never leaves it half-written.
+        """
+        tmp = path.with_name(path.name + ".tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp, flags, mode)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        # O_CREAT's mode only applies to new files - a leftover temp keeps its old bits
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
     
     def save_certificate(self, certificate: dict, fingerprint: str):
-        """Save certificate - encrypted .dat is the source of truth"""
-        cert_data = json.dumps(certificate, indent=2).encode()
-        encrypted = CryptoUtils.encrypt_file(cert_data, fingerprint.encode())
+        """
+        Save certificate - encrypted .dat is the source of truth.
+        Both buffers are built before anything touches disk; each file is replaced atomically.
+        """
+        cert_data = _json_dumps(certificate)
+        fingerprint_bytes = fingerprint.encode("ascii")
+        encrypted = CryptoUtils.encrypt_file(cert_data, fingerprint_bytes)
+        
+        if not self._dirs_ready:
+            self.license_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs_ready = True
         
         # Save encrypted (PRIMARY - source of truth)
-        with open(self.license_dir / "certificate.dat", "wb") as f:
-            f.write(encrypted)
+        self._write_file(self.license_dir / "certificate.dat", encrypted)
         
         # Save fingerprint for later decryption
-        with open(self.license_dir / ".fingerprint", "w") as f:
-            f.write(fingerprint)
+        self._write_file(self.license_dir / ".fingerprint", fingerprint_bytes)
         
-        # Also save JSON for container (container needs it)
-        with open(self.license_dir / "certificate.json", "w") as f:
-            json.dump(certificate, f, indent=2)
+        # Also save JSON for container (container needs it - keep it world-readable)
+        # Same bytes that were encrypted above - serialize once
+        self._write_file(self.license_dir / "certificate.json", cert_data, mode=0o644)
     
     def save_docker_credentials(self, encrypted_creds: str):
-        with open(self.license_dir / "docker_credentials.dat", "w") as f:
-            f.write(encrypted_creds)
+        # Server sends base64 text - write it as ASCII bytes, no newline translation
+        self._write_file(self.license_dir / "docker_credentials.dat", encrypted_creds.encode("ascii"))
     
     def save_compose_file(self, compose_content: str):
-        with open(self.install_dir / "docker-compose.yml", "w") as f:
-            f.write(compose_content)
+        # Encoded once and written raw - compose/docker read it as this user
+        self._write_file(self.install_dir / "docker-compose.yml", compose_content.encode("utf-8"), mode=0o644)
     
     def save_public_key(self, public_key: str):
-        with open(self.license_dir / "public_key.pem", "w") as f:
-            f.write(public_key)
+        # Container verifies signatures with it - keep it world-readable like certificate.json
+        self._write_file(self.license_dir / "public_key.pem", public_key.encode("ascii"), mode=0o644)
+    
+    def save_bundle(self, bundle: dict, fingerprint: str) -> list:
+        """Write every file of an activation bundle, returns what was saved (for the log)"""
+        saved = []
+        self.save_certificate(bundle.get("certificate", {}), fingerprint)
+        saved.append("Certificate")
+        if "docker_credentials" in bundle:
+            self.save_docker_credentials(bundle["docker_credentials"]["encrypted_credentials"])
+            saved.append("Docker credentials (encrypted)")
+        if "compose_file" in bundle:
+            self.save_compose_file(bundle["compose_file"])
+            saved.append("docker-compose.yml")
+        if "public_key" in bundle:
+            self.save_public_key(bundle["public_key"])
+            saved.append("Public key")
+        return saved
     
     def is_activated(self) -> bool:
         """Check if activated - uses encrypted .dat file"""
@@ -416,67 +715,134 @@ class FileManager:
         json_file = self.license_dir / "certificate.json"
         fingerprint_file = self.license_dir / ".fingerprint"
         
-        # Try encrypted .dat file first (secure)
-        if dat_file.exists() and fingerprint_file.exists():
-            try:
-                with open(fingerprint_file, "r") as f:
-                    fingerprint = f.read().strip()
-                
-                with open(dat_file, "rb") as f:
-                    encrypted_data = f.read()
-                
-                decrypted = CryptoUtils.decrypt_file(encrypted_data, fingerprint.encode())
-                return json.loads(decrypted.decode())
-            except Exception as e:
-                print(f"Error reading encrypted certificate: {e}")
-                # Fall through to JSON fallback
+        # Try encrypted .dat file first (secure) - read directly, no exists() stat first
+        try:
+            # Kept as bytes - it is only used as the decryption key
+            fingerprint = fingerprint_file.read_bytes().strip()
+            encrypted_data = dat_file.read_bytes()
+            
+            decrypted = CryptoUtils.decrypt_file(encrypted_data, fingerprint)
+            return _json_loads(decrypted)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error reading encrypted certificate: {e}")
+            # Fall through to JSON fallback
         
         # Fallback to JSON (backward compatibility)
-        if json_file.exists():
-            try:
-                with open(json_file, "r") as f:
-                    return json.load(f)
-            except:
-                pass
+        try:
+            return _json_loads(json_file.read_bytes())
+        except:
+            pass
         
         return None
+    
+    def get_certificate_cached(self) -> dict:
+        """get_certificate(), re-read only when the certificate files change on disk"""
+        key = []
+        for name in ("certificate.dat", "certificate.json"):
+            try:
+                key.append(os.stat(self.license_dir / name).st_mtime_ns)
+            except OSError:
+                key.append(None)
+        key = tuple(key)
+        
+        cached_key, cert = self._cert_cache
+        if cached_key != key or cert is None:
+            cert = self.get_certificate()
+            self._cert_cache = (key, cert)
+        return cert
 
 
 class DockerManager:
     """Docker operations manager"""
     
+    # Long-running docker processes (compose up), terminated if the wizard is closed
+    _running = set()
+    _running_lock = threading.Lock()
+    
     def __init__(self):
         self.install_dir = INSTALL_DIR
+        # Absolute paths, resolved once - each spawn then skips the PATH search
+        # (bare name if not found yet, so a later install is still picked up)
+        self._docker = shutil.which("docker") or "docker"
+        # Standalone compose v1 - None when not installed (no fallback to try)
+        self._docker_compose = shutil.which("docker-compose")
     
     def docker_login(self, registry: str, username: str, token: str) -> bool:
         try:
             result = subprocess.run(
-                ["docker", "login", registry, "-u", username, "--password-stdin"],
-                input=token,
-                capture_output=True,
-                text=True
+                [self._docker, "login", registry, "-u", username, "--password-stdin"],
+                input=token.encode(),
+                # Only the exit code is used - no pipes to drain or decode
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60,
+                **_NO_WINDOW
             )
             return result.returncode == 0
         except:
             return False
     
-    def compose_up(self) -> tuple:
+    def _run_streaming(self, cmd: list, on_line=None) -> tuple:
+        """Run a command, passing each output line (stdout+stderr) to on_line as it arrives"""
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            cwd=str(self.install_dir),
+            # Own process group, so terminate_running() also reaches the compose plugin child
+            start_new_session=(_SYSTEM != "Windows"),
+            **_NO_WINDOW
+        )
+        with DockerManager._running_lock:
+            DockerManager._running.add(proc)
+        try:
+            lines = []
+            for line in proc.stdout:
+                line = line.rstrip()
+                lines.append(line)
+                if on_line:
+                    on_line(line)
+            proc.wait()
+        finally:
+            with DockerManager._running_lock:
+                DockerManager._running.discard(proc)
+        return proc.returncode, "\n".join(lines)
+    
+    @staticmethod
+    def terminate_running():
+        """Terminate docker processes still streaming (wizard window closed)"""
+        with DockerManager._running_lock:
+            running = list(DockerManager._running)
+        for proc in running:
+            try:
+                # `docker compose` runs the compose plugin as a child - stop the whole tree
+                if _SYSTEM == "Windows":
+                    subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **_NO_WINDOW)
+                else:
+                    os.killpg(proc.pid, signal.SIGTERM)
+            except OSError:
+                pass
+    
+    def compose_up(self, on_line=None) -> tuple:
+        """Start services - on_line receives compose progress while images pull/start"""
         compose_file = self.install_dir / "docker-compose.yml"
         try:
-            result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "up", "-d"],
-                capture_output=True,
-                text=True,
-                cwd=str(self.install_dir)
+            returncode, output = self._run_streaming(
+                [self._docker, "compose", "-f", str(compose_file), "up", "-d"], on_line
             )
-            if result.returncode != 0:
-                result = subprocess.run(
-                    ["docker-compose", "-f", str(compose_file), "up", "-d"],
-                    capture_output=True,
-                    text=True,
-                    cwd=str(self.install_dir)
+            # Fall back to compose v1 only if it exists - otherwise keep v2's error output
+            if returncode != 0 and self._docker_compose:
+                returncode, output = self._run_streaming(
+                    [self._docker_compose, "-f", str(compose_file), "up", "-d"], on_line
                 )
-            return result.returncode == 0, result.stdout + result.stderr
+            return returncode == 0, output
         except Exception as e:
             return False, str(e)
     
@@ -484,29 +850,56 @@ class DockerManager:
         compose_file = self.install_dir / "docker-compose.yml"
         try:
             result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "down"],
-                capture_output=True,
-                text=True,
-                cwd=str(self.install_dir)
+                [self._docker, "compose", "-f", str(compose_file), "down"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                cwd=str(self.install_dir),
+                timeout=60,
+                **_NO_WINDOW
             )
             return result.returncode == 0
         except:
             return False
     
-    def check_services_running(self) -> bool:
+    def get_services_status(self) -> dict:
+        """
+        State and health of each compose service from one `ps --format json` call:
+        {service: {"state": "running", "health": "healthy"}} - empty if none are up.
+        """
         compose_file = self.install_dir / "docker-compose.yml"
         if not compose_file.exists():
-            return False
+            return {}
         try:
             result = subprocess.run(
-                ["docker", "compose", "-f", str(compose_file), "ps", "-q"],
+                [self._docker, "compose", "-f", str(compose_file), "ps", "--format", "json"],
                 capture_output=True,
                 text=True,
-                cwd=str(self.install_dir)
+                cwd=str(self.install_dir),
+                timeout=60,
+                **_NO_WINDOW
             )
-            return result.returncode == 0 and bool(result.stdout.strip())
+            if result.returncode != 0:
+                return {}
+            
+            # Older compose prints one JSON array, newer prints one object per line
+            output = result.stdout.strip()
+            if output.startswith("["):
+                containers = _json_loads(output)
+            else:
+                containers = [_json_loads(line) for line in output.splitlines() if line.strip()]
+            
+            return {
+                c.get("Service", c.get("Name", "")): {
+                    "state": c.get("State", ""),
+                    "health": c.get("Health", "")
+                }
+                for c in containers
+            }
         except:
-            return False
+            return {}
+    
+    def check_services_running(self) -> bool:
+        return any(s["state"] == "running" for s in self.get_services_status().values())
 
 
 # ===========================================
@@ -520,6 +913,10 @@ class WizardPage(tk.Frame):
         super().__init__(parent, bg="white")
         self.wizard = wizard
         self.can_proceed = False
+        # Pending lines for the page's log_text (see _log)
+        self._log_pending = []
+        self._log_scheduled = False
+        self._log_lock = threading.Lock()
     
     def on_enter(self):
         """Called when page is shown"""
@@ -532,18 +929,91 @@ class WizardPage(tk.Frame):
     def validate(self) -> bool:
         """Validate page before proceeding"""
         return self.can_proceed
+    
+    def _log(self, message: str, tag: str = ""):
+        """
+        Queue message for the page's log_text - bursts are written in one flush every 50ms.
+        Safe to call from worker threads. tag colors the line if the page configured it.
+        """
+        with self._log_lock:
+            self._log_pending.extend((f"{message}\n", tag))
+            if self._log_scheduled:
+                return
+            self._log_scheduled = True
+        self.after(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued log lines with a single insert"""
+        with self._log_lock:
+            pending, self._log_pending = self._log_pending, []
+            self._log_scheduled = False
+        # Text.insert takes alternating (chars, tags) pairs - still one call
+        self.log_text.insert(tk.END, *pending)
+        self.log_text.see(tk.END)
+        self.log_text.update_idletasks()
+
+
+# Certificate keys that may hold the expiry date, in priority order
+_EXPIRY_KEYS = ("valid_until", "expires", "expiry", "expiration")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_expiry(date_str: str) -> datetime:
+    """Parse a certificate expiry date (cached - the same cert is shown on every visit)"""
+    clean = date_str.replace("Z", "").replace("+00:00", "").strip()
+    
+    # Fast path - ISO dates (what the server issues) via the C parser
+    try:
+        if len(clean) >= 19:
+            return datetime.fromisoformat(clean[:26])
+        if len(clean) >= 10:
+            return datetime.fromisoformat(clean[:10])
+    except ValueError:
+        pass
+    
+    # Try formats
+    for fmt in ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
+        try:
+            return datetime.strptime(clean[:len("2025-12-06T23:59:59.000000")], fmt)
+        except ValueError:
+            continue
+    
+    return datetime.strptime(clean[:10], "%Y-%m-%d")
 
 
 class ManagementPage(WizardPage):
     """Management page for already installed systems - Start/Stop services"""
     
+    # Warning banner per level: (message template, bg, fg, button text)
+    _WARN_TEMPLATES = {
+        "expired": ("⛔ LICENSE EXPIRED!\nServices may stop. Contact admin or renew.", "#f8d7da", "#721c24", "📧 Contact"),
+        "today": ("⚠️ EXPIRES TODAY!\nRenew immediately.", "#f8d7da", "#721c24", "🔄 Renew Now"),
+        "critical": ("⚠️ Expires in {days} day{s}!\nRenew now.", "#f8d7da", "#721c24", "🔄 Renew Now"),
+        "warning": ("⏰ Expires in {days} days.\nRenew soon.", "#fff3cd", "#856404", "🔄 Renew"),
+        "notice": ("License expires in {days} days.", "#fff3cd", "#856404", "🔄 Renew"),
+    }
+    
     def __init__(self, parent, wizard):
         super().__init__(parent, wizard)
         self.can_proceed = True
+        self._last_warn_level = None
+        self._last_running = None
         self.docker_manager = DockerManager()
         self.file_manager = FileManager()
         self._create_widgets()
     
+    @staticmethod
+    def _add_row(parent, label_text, is_bold=False):
+        """Add a 'label: value' row to the info card - returns the value label"""
+        row = tk.Frame(parent, bg="#f8f9fa")
+        row.pack(fill=tk.X, pady=2)
+        tk.Label(row, text=label_text, font="WizardBody", bg="#f8f9fa", 
+                fg="#666", width=10, anchor="w").pack(side=tk.LEFT)
+        val = tk.Label(row, text="...", font="WizardBold" if is_bold else "WizardBody", 
+                      bg="#f8f9fa", anchor="w")
+        val.pack(side=tk.LEFT, fill=tk.X)
+        return val
+    
     def _create_widgets(self):
         # Main container
         main = tk.Frame(self, bg="white")
@@ -556,33 +1026,22 @@ class ManagementPage(WizardPage):
         inner = tk.Frame(card, bg="#f8f9fa")
         inner.pack(fill=tk.X, padx=15, pady=12)
         
-        # Row helper function
-        def add_row(parent, label_text, is_bold=False):
-            row = tk.Frame(parent, bg="#f8f9fa")
-            row.pack(fill=tk.X, pady=2)
-            tk.Label(row, text=label_text, font=("Segoe UI", 9), bg="#f8f9fa", 
-                    fg="#666", width=10, anchor="w").pack(side=tk.LEFT)
-            val = tk.Label(row, text="...", font=("Segoe UI", 9, "bold" if is_bold else "normal"), 
-                          bg="#f8f9fa", anchor="w")
-            val.pack(side=tk.LEFT, fill=tk.X)
-            return val
-        
-        self.customer_val = add_row(inner, "Customer:")
-        self.tier_val = add_row(inner, "Tier:")
-        self.valid_val = add_row(inner, "Valid Until:")
-        self.days_val = add_row(inner, "Remaining:", True)
+        self.customer_val = self._add_row(inner, "Customer:")
+        self.tier_val = self._add_row(inner, "Tier:")
+        self.valid_val = self._add_row(inner, "Valid Until:")
+        self.days_val = self._add_row(inner, "Remaining:", True)
         
         # Separator
         tk.Frame(inner, bg="#dee2e6", height=1).pack(fill=tk.X, pady=8)
         
-        self.status_val = add_row(inner, "Services:", True)
+        self.status_val = self._add_row(inner, "Services:", True)
         
         # Warning box (hidden initially)
         self.warning_box = tk.Frame(main, bg="#fff3cd", relief="solid", bd=1)
         self.warning_inner = tk.Frame(self.warning_box, bg="#fff3cd")
         self.warning_inner.pack(fill=tk.X, padx=12, pady=10)
         
-        self.warning_text = tk.Label(self.warning_inner, text="", font=("Segoe UI", 9),
+        self.warning_text = tk.Label(self.warning_inner, text="", font="WizardBody",
                                      bg="#fff3cd", fg="#856404", wraplength=320, justify=tk.LEFT)
         self.warning_text.pack(anchor="w")
         
@@ -597,17 +1056,30 @@ class ManagementPage(WizardPage):
         self.stop_btn = ttk.Button(self.btns, text="⏹ Stop", command=self._stop, width=12)
         self.open_btn = ttk.Button(self.btns, text="🌐 Open", command=self._open_dash, width=12)
         
+        # Placed once, then toggled with grid()/grid_remove() - no re-layout of options
+        for col, btn in enumerate((self.start_btn, self.stop_btn, self.open_btn)):
+            btn.grid(row=0, column=col, padx=3)
+            btn.grid_remove()
+        
         # Log
-        tk.Label(main, text="Log:", font=("Segoe UI", 8), bg="white", fg="#999", 
+        tk.Label(main, text="Log:", font="WizardSmall", bg="white", fg="#999", 
                 anchor="w").pack(anchor="w", pady=(8,2))
         self.log = tk.Text(main, height=3, font=("Consolas", 8), bg="#f8f9fa", 
                           relief="solid", bd=1, padx=6, pady=4)
         self.log.pack(fill=tk.BOTH, expand=True)
     
     def on_enter(self):
-        """Load certificate and update UI"""
-        cert = self.file_manager.get_certificate()
-        
+        """Load certificate and service state on the executor - the window paints meanwhile"""
+        self.wizard.executor.submit(self._load_certificate)
+        self._update_status()
+    
+    def _load_certificate(self):
+        # Cold read + decrypt (first cryptography import) stays off the Tk thread
+        cert = self.file_manager.get_certificate_cached()
+        self.after(0, self._show_certificate, cert)
+    
+    def _show_certificate(self, cert: dict):
+        """Fill in the license card (Tk thread)"""
         if not cert:
             self.customer_val.config(text="No license found")
             return
@@ -625,11 +1097,7 @@ class ManagementPage(WizardPage):
         self.tier_val.config(text=str(tier).upper())
         
         # Find valid_until - check multiple possible locations
-        valid_until = None
-        for key in ["valid_until", "expires", "expiry", "expiration"]:
-            if key in cert:
-                valid_until = cert[key]
-                break
+        valid_until = next((cert[k] for k in _EXPIRY_KEYS if k in cert), None)
         if not valid_until and "validity" in cert:
             v = cert["validity"]
             if isinstance(v, dict):
@@ -640,34 +1108,17 @@ class ManagementPage(WizardPage):
         else:
             self.valid_val.config(text="N/A")
             self.days_val.config(text="Unknown", fg="#666")
-        
-        self._update_status()
     
     def _show_expiry(self, date_str: str):
         """Parse date and show appropriate warning"""
-        from datetime import datetime
-        
         try:
-            # Try to parse date
-            clean = date_str.replace("Z", "").replace("+00:00", "").strip()
-            
-            # Try formats
-            exp = None
-            for fmt in ["%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]:
-                try:
-                    exp = datetime.strptime(clean[:len("2025-12-06T23:59:59.000000")], fmt)
-                    break
-                except:
-                    continue
-            
-            if not exp:
-                exp = datetime.strptime(clean[:10], "%Y-%m-%d")
+            exp = _parse_expiry(date_str)
             
             # Display
             self.valid_val.config(text=exp.strftime("%b %d, %Y"))
             
-            # Days left
-            days = (exp - datetime.now()).days
+            # Days left - whole calendar days, integer date arithmetic
+            days = (exp.date() - datetime.now().date()).days
             
             if days < 0:
                 self.days_val.config(text=f"EXPIRED ({abs(days)}d ago)", fg="#dc3545")
@@ -698,67 +1149,79 @@ class ManagementPage(WizardPage):
         self.warning_box.pack(fill=tk.X, pady=(0, 8))
         self.renew_btn.pack_forget()
         
-        msgs = {
-            "expired": ("⛔ LICENSE EXPIRED!\nServices may stop. Contact admin or renew.", "#f8d7da", "#721c24", "📧 Contact"),
-            "today": ("⚠️ EXPIRES TODAY!\nRenew immediately.", "#f8d7da", "#721c24", "🔄 Renew Now"),
-            "critical": (f"⚠️ Expires in {days} day{'s' if days>1 else ''}!\nRenew now.", "#f8d7da", "#721c24", "🔄 Renew Now"),
-            "warning": (f"⏰ Expires in {days} days.\nRenew soon.", "#fff3cd", "#856404", "🔄 Renew"),
-            "notice": (f"License expires in {days} days.", "#fff3cd", "#856404", "🔄 Renew"),
-        }
-        
-        msg, bg, fg, btn = msgs.get(level, msgs["notice"])
-        self.warning_box.config(bg=bg)
-        self.warning_inner.config(bg=bg)
-        self.warning_text.config(text=msg, bg=bg, fg=fg)
-        self.renew_btn.config(text=btn)
+        if level not in self._WARN_TEMPLATES:
+            level = "notice"
+        template, bg, fg, btn = self._WARN_TEMPLATES[level]
+        msg = template.format(days=days, s='s' if days > 1 else '')
+        
+        # Restyle only when the level changes - each config redraws the widget
+        if level != self._last_warn_level:
+            self.warning_box.config(bg=bg)
+            self.warning_inner.config(bg=bg)
+            self.warning_text.config(bg=bg, fg=fg)
+            self.renew_btn.config(text=btn)
+            self._last_warn_level = level
+        self.warning_text.config(text=msg)
         self.renew_btn.pack(anchor="w", pady=(6, 0))
     
     def _open_renew(self):
-        import webbrowser
         webbrowser.open(RENEW_URL)
     
     def _update_status(self):
-        """Update service buttons"""
-        self.start_btn.pack_forget()
-        self.stop_btn.pack_forget()
-        self.open_btn.pack_forget()
-        
+        """Refresh service buttons - `compose ps` runs on the executor, not the Tk thread"""
+        self.wizard.executor.submit(self._probe_status)
+    
+    def _probe_status(self):
         running = self.docker_manager.check_services_running()
+        self.after(0, self._show_status, running)
+    
+    def _show_status(self, running: bool):
+        if running == self._last_running:
+            return
+        self._last_running = running
+        
         if running:
             self.status_val.config(text="✓ Running", fg="#28a745")
-            self.stop_btn.pack(side=tk.LEFT, padx=3)
-            self.open_btn.pack(side=tk.LEFT, padx=3)
+            self.start_btn.grid_remove()
+            self.stop_btn.grid()
+            self.open_btn.grid()
         else:
             self.status_val.config(text="○ Stopped", fg="#6c757d")
-            self.start_btn.pack(side=tk.LEFT, padx=3)
+            self.stop_btn.grid_remove()
+            self.open_btn.grid_remove()
+            self.start_btn.grid()
     
     def _log(self, msg: str):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log.insert(tk.END, f"[{ts}] {msg}\n")
+        """Add a timestamped log line - safe to call from the start/stop worker"""
+        ts = time.strftime("%H:%M:%S")
+        self.after(0, self._append_log, f"[{ts}] {msg}\n")
+    
+    def _append_log(self, line: str):
+        self.log.insert(tk.END, line)
         self.log.see(tk.END)
-        self.update()
     
     def _start(self):
-        self.start_btn.pack_forget()
+        self.start_btn.grid_remove()
+        self._last_running = None
         self._log("Starting services...")
         def do():
             ok, out = self.docker_manager.compose_up()
             self._log("✓ Started" if ok else f"✗ Failed: {out}")
-            self.after(0, self._update_status)
-        threading.Thread(target=do, daemon=True).start()
+            self._probe_status()
+        self.wizard.executor.submit(do)
     
     def _stop(self):
-        self.stop_btn.pack_forget()
-        self.open_btn.pack_forget()
+        self.stop_btn.grid_remove()
+        self.open_btn.grid_remove()
+        self._last_running = None
         self._log("Stopping services...")
         def do():
             self.docker_manager.compose_down()
             self._log("✓ Stopped")
-            self.after(0, self._update_status)
-        threading.Thread(target=do, daemon=True).start()
+            self._probe_status()
+        self.wizard.executor.submit(do)
     
     def _open_dash(self):
-        import webbrowser
         webbrowser.open("http://localhost:3005")
         self._log("Opening dashboard...")
 
@@ -787,7 +1250,7 @@ class WelcomePage(WizardPage):
         tk.Label(
             self,
             text=f"Welcome to {APP_NAME} Setup",
-            font=("Segoe UI", 16, "bold"),
+            font="WizardHeader",
             bg="white"
         ).pack(pady=(0, 6))
         
@@ -795,7 +1258,7 @@ class WelcomePage(WizardPage):
         tk.Label(
             self,
             text=f"Version {APP_VERSION}",
-            font=("Segoe UI", 9),
+            font="WizardBody",
             fg="#666666",
             bg="white"
         ).pack(pady=(0, 20))
@@ -807,7 +1270,7 @@ class WelcomePage(WizardPage):
         tk.Label(
             desc_frame,
             text="This wizard will help you:",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="white",
             anchor="w"
         ).pack(anchor="w", pady=(0, 8))
@@ -820,15 +1283,16 @@ class WelcomePage(WizardPage):
             "• Start the services"
         ]
         
-        for step in steps:
-            tk.Label(
-                desc_frame,
-                text=step,
-                font=("Segoe UI", 9),
-                bg="white",
-                fg="#444444",
-                anchor="w"
-            ).pack(anchor="w", pady=1)
+        # One multi-line label instead of a widget per step
+        tk.Label(
+            desc_frame,
+            text="\n".join(steps),
+            font="WizardBody",
+            bg="white",
+            fg="#444444",
+            anchor="w",
+            justify=tk.LEFT
+        ).pack(anchor="w")
         
         # System info
         info_frame = tk.Frame(self, bg="#f8f9fa", relief="solid", bd=1)
@@ -836,27 +1300,28 @@ class WelcomePage(WizardPage):
         
         tk.Label(
             info_frame,
-            text=f"  Hostname: {platform.node()}",
-            font=("Segoe UI", 8),
+            text=(
+                f"  Hostname: {_NODE}\n"
+                f"  OS: {_SYSTEM} {_RELEASE}\n"
+                f"  Install Path: {INSTALL_DIR}"
+            ),
+            font="WizardSmall",
             bg="#f8f9fa",
-            anchor="w"
-        ).pack(anchor="w", pady=(8, 1), padx=10)
-        
-        tk.Label(
-            info_frame,
-            text=f"  OS: {platform.system()} {platform.release()}",
-            font=("Segoe UI", 8),
-            bg="#f8f9fa",
-            anchor="w"
-        ).pack(anchor="w", pady=1, padx=10)
-        
-        tk.Label(
-            info_frame,
-            text=f"  Install Path: {INSTALL_DIR}",
-            font=("Segoe UI", 8),
-            bg="#f8f9fa",
-            anchor="w"
-        ).pack(anchor="w", pady=(1, 8), padx=10)
+            anchor="w",
+            justify=tk.LEFT
+        ).pack(anchor="w", pady=8, padx=10)
+
+
+# Prerequisite rows: (check_id, name, description) - one port row per REQUIRED_PORTS entry
+_CHECK_ITEMS = (
+    ("docker", "Docker Desktop", "Required for running containers"),
+    ("compose", "Docker Compose", "Required for multi-container setup"),
+    ("docker_running", "Docker Daemon", "Docker must be running"),
+    ("disk", "Disk Space", "Minimum 2GB required"),
+    ("memory", "System Memory", "Minimum 2GB RAM recommended"),
+    *((f"port_{port}", f"Port {port} ({name})", "Must be available")
+      for port, name in REQUIRED_PORTS.items()),
+)
 
 
 class PrerequisitesPage(WizardPage):
@@ -865,7 +1330,7 @@ class PrerequisitesPage(WizardPage):
     def __init__(self, parent, wizard):
         super().__init__(parent, wizard)
         self.checks = {}
-        self.check_thread = None
+        self.check_future = None
         self._create_widgets()
     
     def _create_widgets(self):
@@ -880,7 +1345,7 @@ class PrerequisitesPage(WizardPage):
         tk.Label(
             self,
             text="Checking system requirements...",
-            font=("Segoe UI", 9),
+            font="WizardBody",
             fg="#666666",
             bg="white"
         ).pack(pady=(0, 12))
@@ -889,21 +1354,8 @@ class PrerequisitesPage(WizardPage):
         self.checks_frame = tk.Frame(self, bg="white")
         self.checks_frame.pack(fill=tk.BOTH, expand=True, padx=50)
         
-        # Define all checks
-        check_items = [
-            ("docker", "Docker Desktop", "Required for running containers"),
-            ("compose", "Docker Compose", "Required for multi-container setup"),
-            ("docker_running", "Docker Daemon", "Docker must be running"),
-            ("disk", "Disk Space", "Minimum 2GB required"),
-            ("memory", "System Memory", "Minimum 2GB RAM recommended"),
-        ]
-        
-        # Add port checks
-        for port, name in REQUIRED_PORTS.items():
-            check_items.append((f"port_{port}", f"Port {port} ({name})", "Must be available"))
-        
         # Create check rows
-        for check_id, name, desc in check_items:
+        for check_id, name, desc in _CHECK_ITEMS:
             row = tk.Frame(self.checks_frame, bg="white")
             row.pack(fill=tk.X, pady=3)
             
@@ -911,7 +1363,7 @@ class PrerequisitesPage(WizardPage):
             icon_label = tk.Label(
                 row,
                 text="○",
-                font=("Segoe UI", 10),
+                font="WizardText",
                 fg="#6c757d",
                 bg="white",
                 width=2
@@ -925,7 +1377,7 @@ class PrerequisitesPage(WizardPage):
             name_label = tk.Label(
                 text_frame,
                 text=name,
-                font=("Segoe UI", 9),
+                font="WizardBody",
                 bg="white",
                 anchor="w"
             )
@@ -945,7 +1397,7 @@ class PrerequisitesPage(WizardPage):
             status_label = tk.Label(
                 row,
                 text="Checking...",
-                font=("Segoe UI", 8),
+                font="WizardSmall",
                 fg="#6c757d",
                 bg="white",
                 width=22,
@@ -967,14 +1419,14 @@ class PrerequisitesPage(WizardPage):
         self.retry_btn = ttk.Button(
             self.action_frame,
             text="🔄 Re-check",
-            command=self._run_checks
+            command=lambda: self._run_checks(fresh=True)
         )
         
         # Status message
         self.status_label = tk.Label(
             self,
             text="",
-            font=("Segoe UI", 9, "bold"),
+            font="WizardBold",
             bg="white"
         )
         self.status_label.pack(pady=(12, 0))
@@ -983,8 +1435,8 @@ class PrerequisitesPage(WizardPage):
         """Run checks when page is shown"""
         self._run_checks()
     
-    def _run_checks(self):
-        """Run all prerequisite checks"""
+    def _run_checks(self, fresh: bool = False):
+        """Run all prerequisite checks (fresh=True ignores cached results)"""
         self.can_proceed = False
         self.wizard.update_buttons()
         self.retry_btn.pack_forget()
@@ -997,57 +1449,21 @@ class PrerequisitesPage(WizardPage):
             check["passed"] = False
         
         def do_checks():
-            import time
             all_passed = True
             
             try:
-                # Docker installed
-                time.sleep(0.2)
-                passed, info = SystemChecker.check_docker_installed()
-                self._update_check("docker", passed, info)
-                if not passed:
-                    all_passed = False
-                
-                # Docker Compose
-                time.sleep(0.2)
-                passed, info = SystemChecker.check_docker_compose()
-                self._update_check("compose", passed, info)
-                if not passed:
-                    all_passed = False
-                
-                # Docker running
-                time.sleep(0.2)
-                passed, info = SystemChecker.check_docker_running()
-                self._update_check("docker_running", passed, info)
-                if not passed:
-                    all_passed = False
-                
-                # Disk space (check only, doesn't block)
-                time.sleep(0.2)
-                passed, info = SystemChecker.check_disk_space()
-                self._update_check("disk", passed, info)
-                # Temporarily disabled - uncomment to enforce
-                # if not passed:
-                #     all_passed = False
-                
-                # Memory
-                time.sleep(0.2)
-                passed, info = SystemChecker.check_memory()
-                self._update_check("memory", passed, info)
-                # Memory check doesn't block - just informational
-                # if not passed:
-                #     all_passed = False
-                
-                # Ports
-                for port in REQUIRED_PORTS.keys():
-                    time.sleep(0.1)
-                    try:
-                        passed, info = SystemChecker.check_port_available(port)
-                        self._update_check(f"port_{port}", passed, info)
-                        if not passed:
-                            all_passed = False
-                    except Exception as e:
-                        self._update_check(f"port_{port}", True, "Unknown")
+                # First visit reuses the startup probe; Re-check always runs live
+                results = None if fresh else self.wizard.take_prefetched_checks()
+                if results is not None:
+                    for check_id, (passed, info) in results.items():
+                        self._update_check(check_id, passed, info)
+                else:
+                    # Rows update as each check lands, not after the slowest one
+                    results = SystemChecker.run_all_checks(fresh, on_result=self._update_check)
+                for check_id, (passed, info) in results.items():
+                    # Disk space and memory are informational only
+                    if not passed and check_id not in SystemChecker.INFORMATIONAL_CHECKS:
+                        all_passed = False
                 
             except Exception as e:
                 # If any check fails catastrophically, log it but continue
@@ -1059,9 +1475,7 @@ class PrerequisitesPage(WizardPage):
             except Exception as e:
                 print(f"Finish error: {e}")
         
-        self.check_thread = threading.Thread(target=do_checks)
-        self.check_thread.daemon = True
-        self.check_thread.start()
+        self.check_future = self.wizard.executor.submit(do_checks)
     
     def _update_check(self, check_id: str, passed: bool, info: str):
         """Update a single check status"""
@@ -1116,14 +1530,14 @@ class ActivationPage(WizardPage):
         tk.Label(
             self,
             text="License Activation",
-            font=("Segoe UI", 16, "bold"),
+            font="WizardHeader",
             bg="white"
         ).pack(pady=(30, 5))
         
         tk.Label(
             self,
             text="Enter your product key to activate the license",
-            font=("Segoe UI", 10),
+            font="WizardText",
             fg="#666666",
             bg="white"
         ).pack(pady=(0, 30))
@@ -1135,7 +1549,7 @@ class ActivationPage(WizardPage):
         tk.Label(
             key_frame,
             text="Product Key:",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="white",
             anchor="w"
         ).pack(anchor="w")
@@ -1184,6 +1598,12 @@ class ActivationPage(WizardPage):
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
+        # Status colors for log lines
+        self.log_text.tag_configure("ok", foreground="#28a745")
+        self.log_text.tag_configure("warn", foreground="#fd7e14")
+        self.log_text.tag_configure("err", foreground="#dc3545")
+        self.log_text.tag_configure("step", foreground="#6c757d")
+        
         scrollbar = ttk.Scrollbar(self.log_text, command=self.log_text.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.log_text.config(yscrollcommand=scrollbar.set)
@@ -1191,24 +1611,18 @@ class ActivationPage(WizardPage):
     def on_enter(self):
         """Check if already activated"""
         if self.file_manager.is_activated():
-            cert = self.file_manager.get_certificate()
+            cert = self.file_manager.get_certificate_cached()
             if cert:
                 self.can_proceed = True
                 self.key_entry.config(state=tk.DISABLED)
                 self.activate_btn.config(state=tk.DISABLED)
-                self._log("✓ License already activated!")
+                self._log("License already activated!", "ok")
                 self._log(f"  Customer: {cert.get('customer', {}).get('customer_name', 'N/A')}")
                 self._log(f"  Tier: {cert.get('tier', 'N/A').upper()}")
                 self.wizard.update_buttons()
         else:
             self.key_entry.focus()
     
-    def _log(self, message: str):
-        """Add message to log"""
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.update()
-    
     def _activate(self):
         """Start activation process"""
         product_key = self.key_var.get().strip()
@@ -1221,102 +1635,65 @@ class ActivationPage(WizardPage):
         self.activate_btn.config(state=tk.DISABLED)
         self.progress_bar.pack(fill=tk.X, pady=(0, 10))
         
-        thread = threading.Thread(target=self._do_activation, args=(product_key,))
-        thread.daemon = True
-        thread.start()
+        self.wizard.executor.submit(self._do_activation, product_key)
     
     def _do_activation(self, product_key: str):
-        """Perform activation"""
+        """Perform activation (worker thread - widget updates go through after())"""
         try:
-            self.progress_var.set(0)
+            self.after(0, self.progress_var.set, 0)
             
             # Check server
-            self._log("→ Connecting to license server...")
+            self._log("Connecting to license server...", "step")
             if not self.activation_client.check_connection():
                 raise Exception("Cannot connect to license server")
-            self._log("✓ Server connected")
-            self.progress_var.set(10)
+            self._log("Server connected", "ok")
+            self.after(0, self.progress_var.set, 10)
             
             # Generate fingerprint
-            self._log("→ Generating machine fingerprint...")
-            fingerprint = MachineFingerprint.get_fingerprint()
-            self._log(f"✓ Fingerprint: {fingerprint[:24]}...")
-            self.progress_var.set(20)
+            self._log("Generating machine fingerprint...", "step")
+            fingerprint = self.wizard.fingerprint_future.result()
+            self._log(f"Fingerprint: {fingerprint[:24]}...", "ok")
+            self.after(0, self.progress_var.set, 20)
             
             # Setup directories
-            self._log("→ Setting up directories...")
+            self._log("Setting up directories...", "step")
             self.file_manager.setup_directories()
-            self._log("✓ Directories created")
-            self.progress_var.set(30)
+            self._log("Directories created", "ok")
+            self.after(0, self.progress_var.set, 30)
             
             # Activate
-            self._log("→ Activating license...")
+            self._log("Activating license...", "step")
             result = self.activation_client.activate(
                 product_key=product_key,
                 fingerprint=fingerprint,
-                hostname=platform.node(),
-                os_info=f"{platform.system()} {platform.release()}"
+                hostname=_NODE,
+                os_info=f"{_SYSTEM} {_RELEASE}"
             )
-            self._log(f"✓ {result.get('message', 'Activation successful')}")
-            self.progress_var.set(50)
+            self._log(result.get('message', 'Activation successful'), "ok")
+            self.after(0, self.progress_var.set, 50)
             
             bundle = result.get("bundle", {})
             certificate = bundle.get("certificate", {})
             
-            # Save certificate
-            self._log("→ Saving certificate...")
-            self.file_manager.save_certificate(certificate, fingerprint)
-            self._log("✓ Certificate saved")
-            self.progress_var.set(60)
-            
-            # Save Docker credentials
-            if "docker_credentials" in bundle:
-                self._log("→ Saving Docker credentials...")
-                self.file_manager.save_docker_credentials(
-                    bundle["docker_credentials"]["encrypted_credentials"]
-                )
-                self._log("✓ Credentials saved (encrypted)")
-            self.progress_var.set(70)
-            
-            # Save compose file
-            if "compose_file" in bundle:
-                self._log("→ Saving docker-compose.yml...")
-                self.file_manager.save_compose_file(bundle["compose_file"])
-                self._log("✓ Compose file saved")
-            self.progress_var.set(80)
-            
-            # Save public key
-            if "public_key" in bundle:
-                self._log("→ Saving public key...")
-                self.file_manager.save_public_key(bundle["public_key"])
-                self._log("✓ Public key saved")
-            self.progress_var.set(90)
+            # Save certificate, credentials, compose file and public key
+            self._log("Saving license files...", "step")
+            for saved in self.file_manager.save_bundle(bundle, fingerprint):
+                self._log(f"{saved} saved", "ok")
+            self.after(0, self.progress_var.set, 90)
             
             # Docker login
             if "docker_credentials" in bundle:
-                self._log("→ Logging into Docker registry...")
-                try:
-                    creds = CryptoUtils.decrypt_credentials(
-                        bundle["docker_credentials"]["encrypted_credentials"],
-                        fingerprint
-                    )
-                    if self.docker_manager.docker_login(
-                        creds["registry"],
-                        creds["username"],
-                        creds["token"]
-                    ):
-                        self._log("✓ Docker login successful")
-                    else:
-                        self._log("⚠ Docker login failed (may need manual login)")
-                except Exception as e:
-                    self._log(f"⚠ Docker login error: {e}")
+                self._log("Logging into Docker registry...", "step")
+                self._log(*self._docker_login(
+                    bundle["docker_credentials"]["encrypted_credentials"], fingerprint
+                ))
             
-            self.progress_var.set(100)
+            self.after(0, self.progress_var.set, 100)
             
             # Success
             self._log("")
             self._log("═" * 40)
-            self._log("✓ ACTIVATION COMPLETE!")
+            self._log("ACTIVATION COMPLETE!", "ok")
             self._log(f"  Customer: {certificate.get('customer', {}).get('customer_name', 'N/A')}")
             self._log(f"  Tier: {certificate.get('tier', 'N/A').upper()}")
             self._log("═" * 40)
@@ -1326,16 +1703,34 @@ class ActivationPage(WizardPage):
             self.after(0, self.wizard.update_buttons)
             
         except Exception as e:
-            self._log(f"✗ Error: {e}")
-            self.progress_var.set(0)
+            self._log(f"Error: {e}", "err")
+            self.after(0, self.progress_var.set, 0)
             self.after(0, lambda: self.key_entry.config(state=tk.NORMAL))
             self.after(0, lambda: self.activate_btn.config(state=tk.NORMAL))
-            messagebox.showerror("Activation Failed", str(e))
+            self.after(0, messagebox.showerror, "Activation Failed", str(e))
+    
+    def _docker_login(self, encrypted_credentials: str, fingerprint: str) -> tuple:
+        """Log into the bundle's registry - returns (log message, tag)"""
+        try:
+            creds = CryptoUtils.decrypt_credentials(encrypted_credentials, fingerprint)
+            if self.docker_manager.docker_login(creds["registry"], creds["username"], creds["token"]):
+                return "Docker login successful", "ok"
+            return "Docker login failed (may need manual login)", "warn"
+        except Exception as e:
+            return f"Docker login error: {e}", "warn"
 
 
 class InstallationPage(WizardPage):
     """Installation/Service start page"""
     
+    # docker compose status words -> (progress %, label), latest stage first
+    _COMPOSE_STAGES = (
+        ("Started", 95, "Starting services..."),
+        ("Created", 70, "Setting up containers..."),
+        ("Extracting", 40, "Pulling Docker images..."),
+        ("Pulling", 20, "Pulling Docker images..."),
+    )
+    
     def __init__(self, parent, wizard):
         super().__init__(parent, wizard)
         self.docker_manager = DockerManager()
@@ -1347,14 +1742,14 @@ class InstallationPage(WizardPage):
         tk.Label(
             self,
             text="Installation",
-            font=("Segoe UI", 16, "bold"),
+            font="WizardHeader",
             bg="white"
         ).pack(pady=(30, 5))
         
         tk.Label(
             self,
             text="Starting Docker services...",
-            font=("Segoe UI", 10),
+            font="WizardText",
             fg="#666666",
             bg="white"
         ).pack(pady=(0, 30))
@@ -1375,7 +1770,7 @@ class InstallationPage(WizardPage):
         self.progress_label = tk.Label(
             progress_frame,
             text="Preparing...",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="white"
         )
         self.progress_label.pack()
@@ -1394,41 +1789,32 @@ class InstallationPage(WizardPage):
             pady=10
         )
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Status colors for log lines (same tags as ActivationPage)
+        self.log_text.tag_configure("ok", foreground="#28a745")
+        self.log_text.tag_configure("err", foreground="#dc3545")
+        self.log_text.tag_configure("step", foreground="#6c757d")
     
     def on_enter(self):
         """Start installation when page is shown"""
-        thread = threading.Thread(target=self._do_install)
-        thread.daemon = True
-        thread.start()
-    
-    def _log(self, message: str):
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.update()
+        self.wizard.executor.submit(self._do_install)
     
     def _do_install(self):
         """Perform installation"""
-        import time
-        
         try:
-            self.progress_var.set(10)
-            self.after(0, lambda: self.progress_label.config(text="Pulling Docker images..."))
-            self._log("→ Pulling Docker images (this may take a few minutes)...")
-            time.sleep(1)
-            
-            self.progress_var.set(30)
-            self._log("→ Setting up containers...")
+            # Widgets are only touched on the Tk thread - queue updates with after()
+            self.after(0, self._set_progress, 10, "Pulling Docker images...")
+            self._log("Pulling Docker images (this may take a few minutes)...", "step")
+            self._log("Starting Docker services...", "step")
             
-            self.progress_var.set(50)
-            self.after(0, lambda: self.progress_label.config(text="Starting services..."))
-            self._log("→ Starting Docker services...")
-            
-            success, output = self.docker_manager.compose_up()
+            # Show compose's pull/create/start progress live instead of after it exits
+            success, output = self.docker_manager.compose_up(
+                on_line=lambda line: self.after(0, self._on_compose_line, line)
+            )
             
             if success:
-                self.progress_var.set(100)
-                self.after(0, lambda: self.progress_label.config(text="Installation complete!"))
-                self._log("✓ Services started successfully!")
+                self.after(0, self._set_progress, 100, "Installation complete!")
+                self._log("Services started successfully!", "ok")
                 self._log("")
                 self._log("Services running:")
                 self._log("  • Frontend: http://localhost:3005")
@@ -1437,24 +1823,39 @@ class InstallationPage(WizardPage):
                 self.can_proceed = True
                 self.after(0, self.wizard.update_buttons)
             else:
-                self.progress_var.set(0)
-                self.after(0, lambda: self.progress_label.config(text="Installation failed"))
-                self._log(f"✗ Failed to start services")
-                self._log(f"  Error: {output}")
+                self.after(0, self._set_progress, 0, "Installation failed")
+                self._log("Failed to start services", "err")
+                # Full output was already streamed above - repeat just the final error line
+                self._log(f"  Error: {output.splitlines()[-1] if output else 'unknown'}", "err")
                 
                 # Show retry option
                 self.after(0, self._show_retry)
         
         except Exception as e:
-            self._log(f"✗ Error: {e}")
+            self._log(f"Error: {e}", "err")
             self.after(0, self._show_retry)
     
+    def _on_compose_line(self, line: str):
+        """Log a compose output line and advance progress when it reaches a new stage"""
+        self._log(f"  {line}")
+        for word, percent, label in self._COMPOSE_STAGES:
+            if word in line:
+                # Stages of different services interleave - never move backwards
+                if percent > self.progress_var.get():
+                    self._set_progress(percent, label)
+                break
+    
+    def _set_progress(self, percent: int, label: str):
+        """Update progress bar and label (Tk thread only)"""
+        self.progress_var.set(percent)
+        self.progress_label.config(text=label)
+    
     def _show_retry(self):
         """Show retry button"""
         retry_btn = ttk.Button(
             self,
             text="🔄 Retry Installation",
-            command=lambda: threading.Thread(target=self._do_install).start()
+            command=lambda: self.wizard.executor.submit(self._do_install)
         )
         retry_btn.pack(pady=10)
 
@@ -1498,7 +1899,7 @@ class FinishPage(WizardPage):
         self.customer_label = tk.Label(
             self.summary_content,
             text="Customer: -",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="#f8f9fa",
             anchor="w"
         )
@@ -1507,7 +1908,7 @@ class FinishPage(WizardPage):
         self.tier_label = tk.Label(
             self.summary_content,
             text="Tier: -",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="#f8f9fa",
             anchor="w"
         )
@@ -1516,7 +1917,7 @@ class FinishPage(WizardPage):
         self.valid_label = tk.Label(
             self.summary_content,
             text="Valid Until: -",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="#f8f9fa",
             anchor="w"
         )
@@ -1525,7 +1926,7 @@ class FinishPage(WizardPage):
         self.services_label = tk.Label(
             self.summary_content,
             text="Services: -",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="#f8f9fa",
             anchor="w"
         )
@@ -1556,7 +1957,7 @@ class FinishPage(WizardPage):
         tk.Label(
             urls_frame,
             text="Access your application at:",
-            font=("Segoe UI", 10),
+            font="WizardText",
             bg="white"
         ).pack(anchor="w")
         
@@ -1571,7 +1972,7 @@ class FinishPage(WizardPage):
     
     def on_enter(self):
         """Load certificate info"""
-        cert = self.file_manager.get_certificate()
+        cert = self.file_manager.get_certificate_cached()
         if cert:
             customer = cert.get("customer", {})
             self.customer_label.config(text=f"Customer: {customer.get('customer_name', 'N/A')}")
@@ -1590,23 +1991,19 @@ class FinishPage(WizardPage):
     def on_finish(self):
         """Handle finish actions"""
         if self.launch_var.get():
-            import webbrowser
             webbrowser.open("http://localhost:3005")
         
         if self.shortcut_var.get():
-            self._create_shortcut()
+            # Written off the Tk thread so the window closes at once. Its own
+            # (non-daemon) thread, not the executor - _close() cancels queued executor work
+            threading.Thread(target=self._create_shortcut, name="CreateShortcut").start()
     
     def _create_shortcut(self):
         """Create desktop shortcut"""
-        if platform.system() == "Windows":
+        if _SYSTEM == "Windows":
             try:
-                import winreg
-                desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-                shortcut_path = os.path.join(desktop, "AI Dashboard.url")
-                
-                with open(shortcut_path, "w") as f:
-                    f.write("[InternetShortcut]\n")
-                    f.write("URL=http://localhost:3005\n")
+                shortcut_path = Path.home() / "Desktop" / "AI Dashboard.url"
+                shortcut_path.write_text("[InternetShortcut]\nURL=http://localhost:3005\n")
             except:
                 pass
 
@@ -1622,6 +2019,15 @@ class SetupWizard:
         self.root = tk.Tk()
         self.root.configure(bg="white")
         
+        # Keep references - a Font object deletes its named font when collected
+        self.fonts = {name: tkfont.Font(root=self.root, name=name, **opts)
+                      for name, opts in WIZARD_FONTS.items()}
+        
+        # Background work (checks, activation, docker) shares one pool.
+        # Its workers are joined at exit, so closing the window cancels it (_close).
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.root.protocol("WM_DELETE_WINDOW", self._close)
+        
         # Set custom icon if exists
         self._set_icon()
         
@@ -1630,50 +2036,43 @@ class SetupWizard:
         self.is_installed = self.file_manager.is_activated()
         
         # Set window title and size based on mode
+        self.root.title(f"{APP_NAME} Installer")
         if self.is_installed:
-            self.root.title(f"{APP_NAME} Installer")
-            self.root.geometry("420x480")
-            x = (self.root.winfo_screenwidth() - 420) // 2
-            y = (self.root.winfo_screenheight() - 480) // 2
-            self.root.geometry(f"420x480+{x}+{y}")
+            self._center(420, 480)
         else:
-            self.root.title(f"{APP_NAME} Installer")
-            self.root.geometry("700x650")
-            x = (self.root.winfo_screenwidth() - 700) // 2
-            y = (self.root.winfo_screenheight() - 650) // 2
-            self.root.geometry(f"700x650+{x}+{y}")
+            self._center(700, 650)
         
         self.root.resizable(False, False)
         
         # Style
         self.style = ttk.Style()
-        self.style.configure("TButton", font=("Segoe UI", 10), padding=(15, 8))
-        self.style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"))
+        self.style.configure("TButton", font="WizardText", padding=(15, 8))
+        self.style.configure("Accent.TButton", font="WizardTextBold")
         
         # Pages
         self.pages = []
         self.current_page = 0
-        self.step_labels = []
+        self.step_items = []
         
         if self.is_installed:
             self._create_management_layout()
         else:
+            self._start_prefetch()
             self._create_layout()
             self._create_pages()
             self._show_page(0)
     
+    def _center(self, width: int, height: int):
+        """Size the window and center it on screen in one geometry call"""
+        x = (self.root.winfo_screenwidth() - width) // 2
+        y = (self.root.winfo_screenheight() - height) // 2
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
+    
     def _set_icon(self):
         """Set custom window icon"""
         try:
-            # Try to load icon from current directory
-            if os.path.exists(ICON_FILE):
-                self.root.iconbitmap(ICON_FILE)
-            # Try from script directory
-            elif os.path.exists(os.path.join(os.path.dirname(__file__), ICON_FILE)):
-                self.root.iconbitmap(os.path.join(os.path.dirname(__file__), ICON_FILE))
-            # Try from install directory
-            elif os.path.exists(INSTALL_DIR / ICON_FILE):
-                self.root.iconbitmap(str(INSTALL_DIR / ICON_FILE))
+            if _RESOLVED_ICON:
+                self.root.iconbitmap(_RESOLVED_ICON)
         except Exception:
             pass  # Use default icon if custom icon fails
     
@@ -1691,7 +2090,7 @@ class SetupWizard:
         ttk.Button(
             footer_frame,
             text="Close",
-            command=self.root.destroy
+            command=self._close
         ).pack(side=tk.RIGHT, padx=20, pady=10)
         
         ttk.Button(
@@ -1711,33 +2110,48 @@ class SetupWizard:
     def _switch_to_install_mode(self):
         """Switch from management to install mode"""
         if messagebox.askyesno("Reinstall", "This will run the setup wizard again.\n\nContinue?"):
-            self.root.destroy()
-            # Create new wizard in install mode
-            new_wizard = SetupWizard.__new__(SetupWizard)
-            new_wizard.root = tk.Tk()
-            new_wizard.root.title(f"{APP_NAME} - Setup Wizard")
-            new_wizard.root.geometry("700x650")
-            new_wizard.root.resizable(False, False)
-            new_wizard.root.configure(bg="white")
-            
-            x = (new_wizard.root.winfo_screenwidth() - 700) // 2
-            y = (new_wizard.root.winfo_screenheight() - 650) // 2
-            new_wizard.root.geometry(f"700x650+{x}+{y}")
+            # Reuse the running root (fonts, style, icon, executor) - only swap the content
+            self._teardown_management_ui()
+            self.is_installed = False
             
-            new_wizard.style = ttk.Style()
-            new_wizard.style.configure("TButton", font=("Segoe UI", 10), padding=(15, 8))
-            new_wizard.style.configure("Accent.TButton", font=("Segoe UI", 10, "bold"))
+            self.root.title(f"{APP_NAME} - Setup Wizard")
+            self._center(700, 650)
             
-            new_wizard.file_manager = FileManager()
-            new_wizard.is_installed = False
-            new_wizard.pages = []
-            new_wizard.current_page = 0
-            new_wizard.step_labels = []
-            
-            new_wizard._create_layout()
-            new_wizard._create_pages()
-            new_wizard._show_page(0)
-            new_wizard.root.mainloop()
+            self._start_prefetch()
+            self._create_layout()
+            self._create_pages()
+            self._show_page(0)
+    
+    def _start_prefetch(self):
+        """Start slow background work while the user reads the welcome page"""
+        # Fingerprinting is slow on Windows
+        self.fingerprint_future = self.executor.submit(MachineFingerprint.get_fingerprint)
+        # Prerequisite checks spawn docker - probe now so results are ready on page 2
+        self.checks_future = self.executor.submit(self._prefetch_checks)
+    
+    @staticmethod
+    def _prefetch_checks() -> tuple:
+        results = SystemChecker.run_all_checks()
+        return time.monotonic(), results
+    
+    def take_prefetched_checks(self) -> Optional[dict]:
+        """Startup check results, handed out once and only while recent (else None)"""
+        future, self.checks_future = self.checks_future, None
+        if future is None:
+            return None
+        try:
+            finished_at, results = future.result()
+        except Exception:
+            return None
+        if time.monotonic() - finished_at > CHECK_PREFETCH_MAX_AGE:
+            return None
+        return results
+    
+    def _teardown_management_ui(self):
+        """Remove the management layout, keeping the root window"""
+        for child in self.root.winfo_children():
+            child.destroy()
+        self.management_page = None
     
     def _create_layout(self):
         """Create main layout"""
@@ -1747,45 +2161,35 @@ class SetupWizard:
         self.header_frame.pack(fill=tk.X)
         self.header_frame.pack_propagate(False)
         
-        # Step indicators
-        self.steps_frame = tk.Frame(self.header_frame, bg="#f8f9fa")
-        self.steps_frame.pack(expand=True)
-        
-        self.step_labels = []
+        # Step indicators - drawn on one canvas instead of a frame/label pair per step
         step_names = ["Welcome", "Prerequisites", "Activate", "Install", "Finish"]
-        
-        for i, name in enumerate(step_names):
-            step_frame = tk.Frame(self.steps_frame, bg="#f8f9fa")
-            step_frame.pack(side=tk.LEFT, padx=10, pady=15)
-            
-            # Circle indicator
-            circle = tk.Label(
-                step_frame,
-                text=str(i + 1),
-                font=("Segoe UI", 9, "bold"),
-                fg="white",
-                bg="#6c757d",
-                width=3,
-                height=1
-            )
-            circle.pack(side=tk.LEFT, padx=(0, 5))
-            
-            # Step name
-            label = tk.Label(
-                step_frame,
-                text=name,
-                font=("Segoe UI", 9),
-                fg="#6c757d",
-                bg="#f8f9fa"
-            )
-            label.pack(side=tk.LEFT)
-            
-            self.step_labels.append((circle, label))
+        body, bold = self.fonts["WizardBody"], self.fonts["WizardBold"]
+        radius, gap, connector, pad = 11, 5, 30, 10
+        
+        # Each slot fits its name in bold (the current step) so nothing shifts
+        slots = [2 * radius + gap + max(body.measure(n), bold.measure(n)) for n in step_names]
+        width = sum(slots) + (connector + 2 * pad) * (len(step_names) - 1)
+        self.step_canvas = tk.Canvas(self.header_frame, width=width, height=60,
+                                     bg="#f8f9fa", highlightthickness=0)
+        self.step_canvas.pack(expand=True)
+        
+        self.step_items = []
+        x, y = 0, 30
+        for i, (name, slot) in enumerate(zip(step_names, slots)):
+            # Circle indicator, its number and the step name
+            circle = self.step_canvas.create_oval(x, y - radius, x + 2 * radius, y + radius,
+                                                  fill="#6c757d", outline="#6c757d")
+            number = self.step_canvas.create_text(x + radius, y, text=str(i + 1),
+                                                  fill="white", font="WizardBold")
+            label = self.step_canvas.create_text(x + 2 * radius + gap, y, text=name, anchor="w",
+                                                 fill="#6c757d", font="WizardBody")
+            self.step_items.append((circle, number, label))
+            x += slot + pad
             
             # Connector line (except last)
             if i < len(step_names) - 1:
-                line = tk.Frame(self.steps_frame, bg="#dee2e6", width=30, height=2)
-                line.pack(side=tk.LEFT, pady=20)
+                self.step_canvas.create_line(x, y, x + connector, y, fill="#dee2e6", width=2)
+                x += connector + pad
         
         # Content area
         self.content_frame = tk.Frame(self.root, bg="white")
@@ -1824,20 +2228,26 @@ class SetupWizard:
         self.next_btn.pack(side=tk.LEFT)
     
     def _create_pages(self):
-        """Create wizard pages"""
-        self.pages = [
-            WelcomePage(self.content_frame, self),
-            PrerequisitesPage(self.content_frame, self),
-            ActivationPage(self.content_frame, self),
-            InstallationPage(self.content_frame, self),
-            FinishPage(self.content_frame, self)
+        """Register wizard pages - each is built the first time it is shown"""
+        self._page_factories = [
+            WelcomePage,
+            PrerequisitesPage,
+            ActivationPage,
+            InstallationPage,
+            FinishPage
         ]
+        self.pages = [None] * len(self._page_factories)
     
     def _show_page(self, index: int):
         """Show a specific page"""
         # Hide all pages
         for page in self.pages:
-            page.pack_forget()
+            if page is not None:
+                page.pack_forget()
+        
+        # Build on first visit
+        if self.pages[index] is None:
+            self.pages[index] = self._page_factories[index](self.content_frame, self)
         
         # Show current page
         self.current_page = index
@@ -1845,19 +2255,20 @@ class SetupWizard:
         self.pages[index].on_enter()
         
         # Update step indicators
-        for i, (circle, label) in enumerate(self.step_labels):
+        canvas = self.step_canvas
+        for i, (circle, number, label) in enumerate(self.step_items):
             if i < index:
                 # Completed
-                circle.config(text="✓", bg="#28a745")
-                label.config(fg="#28a745")
+                color, text, font = "#28a745", "✓", "WizardBody"
             elif i == index:
                 # Current
-                circle.config(text=str(i + 1), bg="#0d6efd")
-                label.config(fg="#0d6efd", font=("Segoe UI", 9, "bold"))
+                color, text, font = "#0d6efd", str(i + 1), "WizardBold"
             else:
                 # Future
-                circle.config(text=str(i + 1), bg="#6c757d")
-                label.config(fg="#6c757d", font=("Segoe UI", 9))
+                color, text, font = "#6c757d", str(i + 1), "WizardBody"
+            canvas.itemconfig(circle, fill=color, outline=color)
+            canvas.itemconfig(number, text=text)
+            canvas.itemconfig(label, fill=color, font=font)
         
         self.update_buttons()
     
@@ -1907,12 +2318,21 @@ class SetupWizard:
         finish_page = self.pages[-1]
         if hasattr(finish_page, 'on_finish'):
             finish_page.on_finish()
-        self.root.destroy()
+        self._close()
     
     def _cancel(self):
         """Cancel wizard"""
         if messagebox.askyesno("Cancel Setup", "Are you sure you want to cancel the setup?"):
-            self.root.destroy()
+            self._close()
+    
+    def _close(self):
+        """
+        Close the window and stop background work with it - queued tasks are
+        dropped and a running compose is terminated, so no process lingers without a UI.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        DockerManager.terminate_running()
+        self.root.destroy()
     
     def run(self):
         """Run the wizard"""